@@ -13,13 +13,14 @@ __email__ = "mcp@example.com"
 __description__ = "Master Control Program for GitHub repository management"
 
 # Import main classes for easy access
-from .config import MCPConfig
+from .config import MCPConfig, get_config
 from .git_ops import GitOperations
 from .file_ops import FileOperations
 from .logger import get_logger
 
 __all__ = [
     'MCPConfig',
+    'get_config',
     'GitOperations', 
     'FileOperations',
     'get_logger'
@@ -5,9 +5,9 @@ MCP (Master Control Program) - Command Line Interface
 This module provides the main CLI entry point for the MCP tool.
 """
 
-import argparse
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 
 from .config import MCPConfig
 from .git_ops import GitOperations
@@ -15,95 +15,239 @@ from .file_ops import FileOperations
 from .logger import get_logger
 
 
-def create_parser():
-    """Create and configure the argument parser."""
-    parser = argparse.ArgumentParser(
-        prog='mcp',
-        description='MCP (Master Control Program) - GitHub repository management tool',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+HELP_TEXT = """usage: mcp [-h] [--verbose] [--dry-run] {init,clone,push,add-file,add-files} ...
+
+MCP (Master Control Program) - GitHub repository management tool
+
+commands:
+  init                Initialize MCP configuration
+  clone               Clone a GitHub repository
+  push                Push changes to GitHub
+  add-file            Create a file in a specific repository section
+  add-files           Create files listed in a manifest (lines of "section filename")
+
+options:
+  -h, --help          show this help message and exit
+  --verbose, -v       Enable verbose logging
+  --dry-run           Simulate operations without making changes
+
 Examples:
   mcp init                                    # Initialize configuration
   mcp clone https://github.com/user/repo.git ./my-repo
   mcp add-file ./my-repo src/utils helper.py
+  mcp add-files ./my-repo --manifest files.txt --commit "Scaffold modules"
   mcp push ./my-repo "Added helper.py to utils"
-        """
-    )
+"""
+
+# Command name -> (positional arguments, command-specific flags, command-specific
+# options taking a value), each mapping a name to its help text; option help is
+# paired with whether the option is required
+COMMANDS = {
+    'init': ({}, {}, {}),
+    'clone': (
+        {
+            'repo_url': 'GitHub repository URL (e.g., https://github.com/user/repo.git)',
+            'local_path': 'Local path to clone the repository to',
+        },
+        {},
+        {},
+    ),
+    'push': (
+        {
+            'local_path': 'Path to local Git repository',
+            'commit_message': 'Commit message for the changes',
+        },
+        {},
+        {},
+    ),
+    'add-file': (
+        {
+            'local_path': 'Path to local Git repository',
+            'section': 'Section (subdirectory) path relative to repository root',
+            'filename': 'Name of the file to create',
+        },
+        {'--overwrite': 'Overwrite existing file without prompting'},
+        {},
+    ),
+    'add-files': (
+        {'local_path': 'Path to local Git repository'},
+        {'--overwrite': 'Overwrite existing files without prompting'},
+        {
+            '--manifest': (True, 'File with one "section filename" pair per line; '
+                                 'blank lines and lines starting with # are ignored'),
+            '--commit': (False, 'Commit the created files with this message'),
+        },
+    ),
+}
+
+GLOBAL_FLAGS = {
+    '--verbose': 'verbose',
+    '-v': 'verbose',
+    '--dry-run': 'dry_run',
+}
+
+
+class UsageError(Exception):
+    """Raised when command line arguments are invalid."""
+
+
+def command_usage(command):
+    """
+    Build the help text for a single command.
     
-    # Global options
-    parser.add_argument(
-        '--verbose', '-v',
-        action='store_true',
-        help='Enable verbose logging'
-    )
+    Args:
+        command (str): Command name
+        
+    Returns:
+        str: Usage line followed by a description of each argument
+    """
+    positionals, flags, options = COMMANDS[command]
+    parts = ['usage: mcp', command, '[-h]']
+    parts.extend(f'[{flag}]' for flag in flags)
+    for option, (required, _) in options.items():
+        usage = f'{option} {option[2:].upper()}'
+        parts.append(usage if required else f'[{usage}]')
+    parts.extend(positionals)
     
-    parser.add_argument(
-        '--dry-run',
-        action='store_true',
-        help='Simulate operations without making changes'
-    )
+    option_rows = [('-h, --help', 'show this help message and exit')]
+    option_rows.extend(flags.items())
+    option_rows.extend((f'{option} {option[2:].upper()}', help_text) for option, (_, help_text) in options.items())
+    width = max(len(name) for name, _ in [*positionals.items(), *option_rows]) + 2
     
-    # Subcommands
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
+    lines = [' '.join(parts)]
+    if positionals:
+        lines += ['', 'positional arguments:']
+        lines += [f'  {name.ljust(width)}{help_text}' for name, help_text in positionals.items()]
+    lines += ['', 'options:']
+    lines += [f'  {name.ljust(width)}{help_text}' for name, help_text in option_rows]
+    return '\n'.join(lines)
+
+
+def _match_option(arg, spec):
+    """
+    Resolve an option the way argparse does.
     
-    # Init command
-    init_parser = subparsers.add_parser(
-        'init',
-        help='Initialize MCP configuration'
-    )
+    Accepts exact names, ``--option=value`` and unambiguous prefixes of
+    long options (``--dry`` for ``--dry-run``).
     
-    # Clone command
-    clone_parser = subparsers.add_parser(
-        'clone',
-        help='Clone a GitHub repository'
-    )
-    clone_parser.add_argument(
-        'repo_url',
-        help='GitHub repository URL (e.g., https://github.com/user/repo.git)'
-    )
-    clone_parser.add_argument(
-        'local_path',
-        help='Local path to clone the repository to'
-    )
+    Args:
+        arg (str): Dash-prefixed command line argument
+        spec (tuple): COMMANDS entry of the selected command, or None
+        
+    Returns:
+        tuple: (option name, inline value or None), or None if unknown
+        
+    Raises:
+        UsageError: If a prefix matches more than one option
+    """
+    known = ['-h', '--help', *GLOBAL_FLAGS]
+    if spec:
+        known.extend(spec[1])
+        known.extend(spec[2])
     
-    # Push command
-    push_parser = subparsers.add_parser(
-        'push',
-        help='Push changes to GitHub'
-    )
-    push_parser.add_argument(
-        'local_path',
-        help='Path to local Git repository'
-    )
-    push_parser.add_argument(
-        'commit_message',
-        help='Commit message for the changes'
-    )
+    if arg in known:
+        return arg, None
+    name, eq, value = arg.partition('=')
+    if eq and name in known:
+        return name, value
     
-    # Add-file command
-    add_file_parser = subparsers.add_parser(
-        'add-file',
-        help='Create a file in a specific repository section'
-    )
-    add_file_parser.add_argument(
-        'local_path',
-        help='Path to local Git repository'
-    )
-    add_file_parser.add_argument(
-        'section',
-        help='Section (subdirectory) path relative to repository root'
-    )
-    add_file_parser.add_argument(
-        'filename',
-        help='Name of the file to create'
-    )
-    add_file_parser.add_argument(
-        '--overwrite',
-        action='store_true',
-        help='Overwrite existing file without prompting'
-    )
+    if name.startswith('--'):
+        matches = [option for option in known if option.startswith(name)]
+        if len(matches) > 1:
+            raise UsageError(f"ambiguous option: {name} could match {', '.join(matches)}")
+        if matches:
+            return matches[0], value if eq else None
+    return None
+
+
+def parse_args(argv):
+    """
+    Parse command line arguments without argparse.
+    
+    Args:
+        argv (list): Command line arguments, excluding the program name
+        
+    Returns:
+        SimpleNamespace: Parsed arguments; ``command`` is None when help
+        was requested or no command was given
+        
+    Raises:
+        UsageError: If the arguments are invalid
+    """
+    args = SimpleNamespace(command=None, verbose=False, dry_run=False, overwrite=False, help=False,
+                           manifest=None, commit=None)
+    positionals = []
+    options_done = False
+    spec = None
+    remaining = iter(argv)
+    
+    for arg in remaining:
+        option = None
+        if not options_done and arg.startswith('-') and arg not in ('-', '--'):
+            option = _match_option(arg, spec)
+        
+        if option is None:
+            if arg == '--' and not options_done:
+                options_done = True
+                continue
+            # Like argparse, a dash-prefixed argument containing a space is a value, not an option
+            if not options_done and arg.startswith('-') and arg != '-' and ' ' not in arg:
+                raise UsageError(f"unrecognized arguments: {arg}")
+            positionals.append(arg)
+            # The first positional selects the command and its options
+            if len(positionals) == 1:
+                spec = COMMANDS.get(arg)
+            continue
+        
+        name, value = option
+        if spec and name in spec[2]:
+            if value is None:
+                value = next(remaining, None)
+            if value is None:
+                raise UsageError(f"argument {name}: expected one argument")
+            setattr(args, name[2:].replace('-', '_'), value)
+            continue
+        
+        if value is not None:
+            raise UsageError(f"argument {name}: ignored explicit argument '{value}'")
+        if name in GLOBAL_FLAGS:
+            setattr(args, GLOBAL_FLAGS[name], True)
+        elif name in ('-h', '--help'):
+            args.help = True
+        else:
+            setattr(args, name[2:].replace('-', '_'), True)
     
-    return parser
+    if not positionals:
+        return args
+    
+    command = positionals.pop(0)
+    if command not in COMMANDS:
+        choices = ', '.join(f"'{name}'" for name in COMMANDS)
+        raise UsageError(f"invalid choice: '{command}' (choose from {choices})")
+    args.command = command
+    
+    if args.help:
+        return args
+    
+    names, _, options = COMMANDS[command]
+    names = tuple(names)
+    missing_options = [
+        option for option, (required, _) in options.items()
+        if required and getattr(args, option[2:].replace('-', '_')) is None
+    ]
+    if missing_options:
+        raise UsageError(f"the following arguments are required: {', '.join(missing_options)}")
+    
+    if len(positionals) < len(names):
+        missing = ', '.join(names[len(positionals):])
+        raise UsageError(f"the following arguments are required: {missing}")
+    if len(positionals) > len(names):
+        raise UsageError(f"unrecognized arguments: {' '.join(positionals[len(names):])}")
+    
+    for name, value in zip(names, positionals):
+        setattr(args, name, value)
+    
+    return args
 
 
 def handle_init(args, config, logger):
@@ -163,14 +307,92 @@ def handle_add_file(args, file_ops, logger):
         return 1
 
 
-def main():
-    """Main entry point for the MCP tool."""
-    parser = create_parser()
-    args = parser.parse_args()
+def read_manifest(manifest_path):
+    """
+    Read an add-files manifest.
+    
+    Each non-blank line holds a section and a filename separated by
+    whitespace; lines starting with '#' are ignored.
     
-    # Show help if no command provided
+    Args:
+        manifest_path (str): Path to manifest file
+        
+    Returns:
+        list: (section, filename) tuples
+        
+    Raises:
+        ValueError: If a line is malformed
+    """
+    entries = []
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            
+            fields = line.split()
+            if len(fields) != 2:
+                raise ValueError(f"{manifest_path}:{line_number}: expected 'section filename', got '{line}'")
+            entries.append((fields[0], fields[1]))
+    
+    return entries
+
+
+def handle_add_files(args, file_ops, git_ops, logger):
+    """Handle the add-files command."""
+    try:
+        entries = read_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        logger.error(f"Failed to read manifest: {e}")
+        return 1
+    
+    logger.info(f"Creating {len(entries)} files from manifest {args.manifest}...")
+    
+    created = file_ops.add_files_to_sections(
+        args.local_path,
+        entries,
+        dry_run=args.dry_run,
+        overwrite=args.overwrite
+    )
+    failed = len(entries) - len(created)
+    
+    if args.commit and created:
+        if not git_ops.commit_files(args.local_path, created, args.commit, dry_run=args.dry_run):
+            logger.error("Failed to commit created files.")
+            return 1
+    
+    if failed:
+        logger.error(f"Failed to create {failed} of {len(entries)} files.")
+        return 1
+    
+    if not args.dry_run:
+        logger.info(f"Created {len(created)} files successfully.")
+    return 0
+
+
+def dispatch(argv):
+    """
+    Parse arguments and route to the matching command handler.
+    
+    Args:
+        argv (list): Command line arguments, excluding the program name
+        
+    Returns:
+        int: Process exit code
+    """
+    try:
+        args = parse_args(argv)
+    except UsageError as e:
+        print(HELP_TEXT.splitlines()[0], file=sys.stderr)
+        print(f"mcp: error: {e}", file=sys.stderr)
+        return 2
+    
+    # Show help if requested or no command provided
+    if args.help:
+        print(command_usage(args.command) if args.command else HELP_TEXT)
+        return 0
     if not args.command:
-        parser.print_help()
+        print(HELP_TEXT)
         return 0
     
     # Initialize logger
@@ -178,7 +400,7 @@ def main():
     
     # Initialize components
     config = MCPConfig(verbose=args.verbose)
-    git_ops = GitOperations(verbose=args.verbose)
+    git_ops = GitOperations(verbose=args.verbose, config=config)
     file_ops = FileOperations(verbose=args.verbose)
     
     try:
@@ -191,6 +413,8 @@ def main():
             return handle_push(args, git_ops, logger)
         elif args.command == 'add-file':
             return handle_add_file(args, file_ops, logger)
+        elif args.command == 'add-files':
+            return handle_add_files(args, file_ops, git_ops, logger)
         else:
             logger.error(f"Unknown command: {args.command}")
             return 2
@@ -206,5 +430,10 @@ def main():
         return 1
 
 
+def main():
+    """Main entry point for the MCP tool."""
+    return dispatch(sys.argv[1:])
+
+
 if __name__ == '__main__':
     sys.exit(main())
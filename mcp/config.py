@@ -5,11 +5,16 @@ Handles GitHub tokens, configuration files, and initialization.
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 from .logger import get_logger
 
 
+# Environment variables from .env only need to be loaded once per process
+_DOTENV_LOADED = False
+
+
 class MCPConfig:
     """Configuration manager for MCP tool."""
     
@@ -28,9 +33,13 @@ class MCPConfig:
             'default_branch': 'main',
             'log_level': 'INFO'
         }
+        self._config_cache = None
         
         # Load environment variables
-        load_dotenv()
+        global _DOTENV_LOADED
+        if not _DOTENV_LOADED:
+            load_dotenv()
+            _DOTENV_LOADED = True
         
         # Ensure config directory exists
         self.config_dir.mkdir(exist_ok=True)
@@ -62,6 +71,7 @@ class MCPConfig:
             # Save configuration
             with open(self.config_file, 'w') as f:
                 json.dump(self.default_config, f, indent=2)
+            self.invalidate()
             
             self.logger.info(f"Configuration initialized at {self.config_file}")
             
@@ -78,9 +88,15 @@ class MCPConfig:
         """
         Load configuration from file and environment variables.
         
+        The result is cached on the instance; call invalidate() to force
+        the next call to re-read the file and environment.
+        
         Returns:
             dict: Configuration dictionary
         """
+        if self._config_cache is not None:
+            return self._config_cache
+        
         config = self.default_config.copy()
         
         # Load from config file if it exists
@@ -89,7 +105,7 @@ class MCPConfig:
                 with open(self.config_file, 'r') as f:
                     file_config = json.load(f)
                     config.update(file_config)
-                self.logger.debug(f"Loaded configuration from {self.config_file}")
+                self.logger.debug("Loaded configuration from %s", self.config_file)
             except Exception as e:
                 self.logger.warning(f"Failed to load config file: {e}")
         
@@ -99,8 +115,13 @@ class MCPConfig:
             config['github_token'] = github_token
             self.logger.debug("Using GitHub token from environment variable")
         
+        self._config_cache = config
         return config
     
+    def invalidate(self):
+        """Discard the cached configuration so it is reloaded on next use."""
+        self._config_cache = None
+    
     def get_github_token(self):
         """
         Get GitHub token from configuration or environment.
@@ -142,3 +163,15 @@ class MCPConfig:
             'enable_cors': config.get('enable_cors', os.getenv('MCP_ENABLE_CORS', 'true').lower() == 'true'),
             'log_level': config.get('log_level', os.getenv('MCP_LOG_LEVEL', 'INFO'))
         }
+
+
+@lru_cache(maxsize=1)
+def get_config():
+    """
+    Get the process-wide configuration manager.
+    
+    Returns:
+        MCPConfig: Shared configuration instance; call its invalidate()
+        to pick up changes to the configuration file
+    """
+    return MCPConfig()
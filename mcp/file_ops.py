@@ -5,10 +5,26 @@ Provides file creation and directory management functionality.
 
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from .logger import get_logger
 
 
+# Characters not allowed in filenames on common platforms, as a deletion table
+_INVALID_TT = str.maketrans('', '', '<>:"/\\|?*')
+
+# Same as above, but separators are legal within a path; a backslash is only
+# a separator on Windows and stays invalid inside a name elsewhere
+_INVALID_PATH_RE = re.compile(r'[<>:"|?*]' if os.altsep else r'[<>:"|?*\\]')
+
+# Reserved device names on Windows
+_RESERVED_NAMES = frozenset({
+    'CON', 'PRN', 'AUX', 'NUL',
+    'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
+    'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
+})
+
+
 class FileOperations:
     """File operations manager for MCP tool."""
     
@@ -21,7 +37,9 @@ class FileOperations:
         """
         self.logger = get_logger(verbose=verbose)
     
-    def is_valid_filename(self, filename):
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def is_valid_filename(filename):
         """
         Check if filename is valid for cross-platform compatibility.
         
@@ -31,20 +49,14 @@ class FileOperations:
         Returns:
             bool: True if valid, False otherwise
         """
-        # Check for invalid characters
-        invalid_chars = r'[<>:"/\\|?*]'
-        if re.search(invalid_chars, filename):
+        # Check for invalid characters (translate drops them, changing the length)
+        if len(filename.translate(_INVALID_TT)) != len(filename):
             return False
         
         # Check for reserved names on Windows
-        reserved_names = {
-            'CON', 'PRN', 'AUX', 'NUL',
-            'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
-            'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
-        }
-        
-        name_without_ext = filename.split('.')[0].upper()
-        if name_without_ext in reserved_names:
+        dot = filename.find('.')
+        name_without_ext = filename if dot < 0 else filename[:dot]
+        if name_without_ext.upper() in _RESERVED_NAMES:
             return False
         
         # Check length (255 is common filesystem limit)
@@ -57,7 +69,9 @@ class FileOperations:
         
         return True
     
-    def is_valid_path(self, path):
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def is_valid_path(path):
         """
         Check if path is valid and safe.
         
@@ -68,16 +82,29 @@ class FileOperations:
             bool: True if valid, False otherwise
         """
         try:
-            # Convert to Path object for validation
-            path_obj = Path(path)
+            # Check for invalid characters in a single scan of the whole path
+            if _INVALID_PATH_RE.search(path):
+                return False
             
-            # Check for path traversal attempts
-            if '..' in path_obj.parts:
+            # Absolute paths would escape the repository root
+            if os.altsep:
+                path = path.replace(os.altsep, os.sep)
+            if path.startswith(os.sep):
                 return False
             
-            # Check each part of the path
-            for part in path_obj.parts:
-                if not self.is_valid_filename(part):
+            for part in path.split(os.sep):
+                # Empty and current-directory components are no-ops
+                if part in ('', '.'):
+                    continue
+                
+                # Check for path traversal attempts
+                if part == '..':
+                    return False
+                
+                # Check reserved names, length and whitespace-only parts
+                if part.split('.')[0].upper() in _RESERVED_NAMES:
+                    return False
+                if len(part) > 255 or not part.strip():
                     return False
             
             return True
@@ -99,22 +126,32 @@ class FileOperations:
         try:
             path_obj = Path(directory_path)
             
-            if path_obj.exists():
+            if dry_run:
                 if path_obj.is_dir():
-                    self.logger.debug(f"Directory already exists: {directory_path}")
+                    self.logger.debug("Directory already exists: %s", directory_path)
                     return True
-                else:
+                if path_obj.exists():
                     self.logger.error(f"Path exists but is not a directory: {directory_path}")
                     return False
-            
-            if dry_run:
                 self.logger.info(f"[DRY RUN] Would create directory: {directory_path}")
                 return True
             
-            path_obj.mkdir(parents=True, exist_ok=True)
+            # Try to create first; only inspect the path if something is already there
+            try:
+                path_obj.mkdir(parents=True)
+            except FileExistsError:
+                if path_obj.is_dir():
+                    self.logger.debug("Directory already exists: %s", directory_path)
+                    return True
+                self.logger.error(f"Path exists but is not a directory: {directory_path}")
+                return False
+            
             self.logger.info(f"Created directory: {directory_path}")
             return True
             
+        except NotADirectoryError:
+            self.logger.error(f"Parent path is not a directory: {directory_path}")
+            return False
         except PermissionError:
             self.logger.error(f"Permission denied creating directory: {directory_path}")
             return False
@@ -122,6 +159,22 @@ class FileOperations:
             self.logger.error(f"Failed to create directory {directory_path}: {e}")
             return False
     
+    def _confirm_overwrite(self, file_path):
+        """
+        Ask the user whether an existing file may be overwritten.
+        
+        Args:
+            file_path (str): Path to existing file
+            
+        Returns:
+            bool: True if the user confirmed, False otherwise
+        """
+        response = input(f"File {file_path} already exists. Overwrite? (y/N): ")
+        if response.lower() != 'y':
+            self.logger.info("File creation cancelled.")
+            return False
+        return True
+    
     def create_file(self, file_path, dry_run=False, overwrite=False):
         """
         Create an empty file (equivalent to touch command).
@@ -134,44 +187,60 @@ class FileOperations:
         Returns:
             bool: True if successful, False otherwise
         """
-        try:
-            path_obj = Path(file_path)
-            
-            # Validate filename
-            if not self.is_valid_filename(path_obj.name):
-                self.logger.error(f"Invalid filename: {path_obj.name}")
-                return False
-            
-            # Check if file already exists
-            if path_obj.exists():
-                if not overwrite:
-                    response = input(f"File {file_path} already exists. Overwrite? (y/N): ")
-                    if response.lower() != 'y':
-                        self.logger.info("File creation cancelled.")
-                        return False
-                
-                if dry_run:
-                    self.logger.info(f"[DRY RUN] Would overwrite file: {file_path}")
-                    return True
+        path_obj = Path(file_path)
+        
+        # Validate filename
+        if not self.is_valid_filename(path_obj.name):
+            self.logger.error(f"Invalid filename: {path_obj.name}")
+            return False
+        
+        return self._create_file_unchecked(path_obj, dry_run=dry_run, overwrite=overwrite)
+    
+    def _create_file_unchecked(self, path_obj, dry_run=False, overwrite=False):
+        """
+        Create an empty file whose name has already been validated.
+        
+        Args:
+            path_obj (Path): Path to file
+            dry_run (bool): If True, simulate operation without making changes
+            overwrite (bool): If True, overwrite existing file without prompting
             
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
             # Create parent directories if they don't exist
             if not self.create_directory(path_obj.parent, dry_run=dry_run):
                 return False
             
             if dry_run:
-                self.logger.info(f"[DRY RUN] Would create file: {file_path}")
+                if path_obj.exists():
+                    if not overwrite and not self._confirm_overwrite(path_obj):
+                        return False
+                    self.logger.info(f"[DRY RUN] Would overwrite file: {path_obj}")
+                else:
+                    self.logger.info(f"[DRY RUN] Would create file: {path_obj}")
                 return True
             
-            # Create the file
-            path_obj.touch()
-            self.logger.info(f"Created file: {file_path}")
+            # Create the file; O_EXCL makes the existence check part of the same call
+            flags = os.O_CREAT | os.O_WRONLY
+            if not overwrite:
+                flags |= os.O_EXCL
+            try:
+                fd = os.open(path_obj, flags, 0o666)
+            except FileExistsError:
+                if not self._confirm_overwrite(path_obj):
+                    return False
+                fd = os.open(path_obj, os.O_CREAT | os.O_WRONLY, 0o666)
+            os.close(fd)
+            self.logger.info(f"Created file: {path_obj}")
             return True
             
         except PermissionError:
-            self.logger.error(f"Permission denied creating file: {file_path}")
+            self.logger.error(f"Permission denied creating file: {path_obj}")
             return False
         except Exception as e:
-            self.logger.error(f"Failed to create file {file_path}: {e}")
+            self.logger.error(f"Failed to create file {path_obj}: {e}")
             return False
     
     def add_file_to_section(self, repo_path, section, filename, dry_run=False, overwrite=False):
@@ -205,13 +274,83 @@ class FileOperations:
                 self.logger.error(f"Invalid section path: {section}")
                 return False
             
+            # Validate filename once; the file is then created without re-checking it
+            if not self.is_valid_filename(filename):
+                self.logger.error(f"Invalid filename: {filename}")
+                return False
+            
             # Construct full path
             section_path = repo_path_obj / section
             file_path = section_path / filename
             
             # Create the file
-            return self.create_file(str(file_path), dry_run=dry_run, overwrite=overwrite)
+            return self._create_file_unchecked(file_path, dry_run=dry_run, overwrite=overwrite)
             
         except Exception as e:
             self.logger.error(f"Failed to add file to section: {e}")
             return False
+    
+    def add_files_to_sections(self, repo_path, entries, dry_run=False, overwrite=False):
+        """
+        Add several files to sections of a repository in one pass.
+        
+        Each distinct section directory is created once, and new files are
+        created with a single exclusive open instead of a per-file existence
+        check, directory check and touch.
+        
+        Args:
+            repo_path (str): Path to repository
+            entries (list): (section, filename) tuples
+            dry_run (bool): If True, simulate operation without making changes
+            overwrite (bool): If True, overwrite existing files without prompting
+            
+        Returns:
+            list: Paths of the created files, relative to the repository
+        """
+        repo_path_obj = Path(repo_path)
+        
+        # Validate repository path
+        if not repo_path_obj.is_dir():
+            self.logger.error(f"Repository path is not a directory: {repo_path}")
+            return []
+        
+        # Validate all entries up front and group them by section
+        sections = {}
+        for section, filename in entries:
+            if not self.is_valid_path(section):
+                self.logger.error(f"Invalid section path: {section}")
+            elif not self.is_valid_filename(filename):
+                self.logger.error(f"Invalid filename: {filename}")
+            else:
+                sections.setdefault(section, []).append(filename)
+        
+        created = []
+        for section, filenames in sections.items():
+            section_path = repo_path_obj / section
+            if not self.create_directory(section_path, dry_run=dry_run):
+                continue
+            
+            for filename in filenames:
+                file_path = section_path / filename
+                relative_path = str(Path(section) / filename)
+                
+                if dry_run:
+                    if self._create_file_unchecked(file_path, dry_run=True, overwrite=overwrite):
+                        created.append(relative_path)
+                    continue
+                
+                try:
+                    fd = os.open(file_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+                    os.close(fd)
+                    self.logger.info(f"Created file: {file_path}")
+                except FileExistsError:
+                    # Fall back to the single-file path for prompting/overwrite
+                    if not self._create_file_unchecked(file_path, overwrite=overwrite):
+                        continue
+                except OSError as e:
+                    self.logger.error(f"Failed to create file {file_path}: {e}")
+                    continue
+                
+                created.append(relative_path)
+        
+        return created
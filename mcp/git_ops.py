@@ -3,31 +3,91 @@ Git operations module for MCP tool.
 Handles repository cloning, pushing changes, and Git repository management using GitPython.
 """
 
+import atexit
+import base64
 import os
 import re
+import tempfile
+from functools import lru_cache
 from pathlib import Path
-from urllib.parse import urlparse
-import git
-from git import Repo, InvalidGitRepositoryError, GitCommandError
-from github import Github, GithubException
 from .config import MCPConfig
 from .logger import get_logger
 
 
+# github.com/<owner>/<repo>[.git] with anything after the repository name;
+# owner and repo allow alphanumerics, hyphens, underscores and dots
+_REPO_URL_RE = re.compile(
+    r'^(?:[a-zA-Z][a-zA-Z0-9+.-]*:)?//(?:www\.)?github\.com/+'
+    r'[a-zA-Z0-9._-]+/([a-zA-Z0-9._-]+)(?:[/?#].*)?\Z',
+    re.DOTALL,
+)
+
+# GitPython is imported on first use so commands that never touch Git
+# (init, add-file) don't pay for it at startup
+_git = None
+
+
+def _load_git():
+    """
+    Import GitPython on first use.
+    
+    Returns:
+        module: The ``git`` package
+    """
+    global _git
+    if _git is None:
+        import git
+        _git = git
+    return _git
+
+
+# First git release that reads configuration from GIT_CONFIG_COUNT/KEY/VALUE
+_GIT_CONFIG_ENV_VERSION = (2, 31)
+
+# Answers git's credential prompts from the environment, so the script
+# itself holds no secret
+_ASKPASS_SCRIPT = """#!/bin/sh
+case "$1" in
+    Username*) echo x-access-token ;;
+    *) echo "$MCP_GIT_TOKEN" ;;
+esac
+"""
+
+
+@lru_cache(maxsize=1)
+def _askpass_helper():
+    """
+    Write the askpass script once per process.
+    
+    Returns:
+        str: Path to the executable script, removed at exit
+    """
+    fd, path = tempfile.mkstemp(prefix='mcp-askpass-', suffix='.sh')
+    with os.fdopen(fd, 'w') as script:
+        script.write(_ASKPASS_SCRIPT)
+    os.chmod(path, 0o700)
+    atexit.register(os.remove, path)
+    return path
+
+
 class GitOperations:
     """Git operations manager for MCP tool."""
     
-    def __init__(self, verbose=False):
+    def __init__(self, verbose=False, config=None):
         """
         Initialize Git operations manager.
         
         Args:
             verbose (bool): Enable verbose logging
+            config (MCPConfig): Shared configuration manager; a new one is
+                created if not given
         """
         self.logger = get_logger(verbose=verbose)
-        self.config = MCPConfig(verbose=verbose)
+        self.config = config or MCPConfig(verbose=verbose)
     
-    def is_valid_repo_url(self, url):
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def is_valid_repo_url(url):
         """
         Validate GitHub repository URL.
         
@@ -37,36 +97,30 @@ class GitOperations:
         Returns:
             bool: True if valid, False otherwise
         """
-        try:
-            parsed = urlparse(url)
-            
-            # Check if it's a GitHub URL
-            if parsed.netloc not in ['github.com', 'www.github.com']:
-                return False
-            
-            # Check path format (should be /username/repo or /username/repo.git)
-            path_parts = parsed.path.strip('/').split('/')
-            if len(path_parts) < 2:
-                return False
-            
-            # Basic validation of username and repo name
-            username, repo = path_parts[0], path_parts[1]
-            if not username or not repo:
-                return False
-            
-            # Remove .git suffix if present
-            if repo.endswith('.git'):
-                repo = repo[:-4]
-            
-            # Check for valid characters (GitHub allows alphanumeric, hyphens, underscores, dots)
-            valid_pattern = re.compile(r'^[a-zA-Z0-9._-]+$')
-            if not valid_pattern.match(username) or not valid_pattern.match(repo):
-                return False
-            
-            return True
+        if not isinstance(url, str):
+            return False
+        
+        match = _REPO_URL_RE.match(url)
+        # A bare ".git" is an empty repository name once the suffix is removed
+        return match is not None and match.group(1) != '.git'
+    
+    def _open_repo(self, path):
+        """
+        Open the Git repository at path.
+        
+        Args:
+            path (str): Path to repository
             
+        Returns:
+            git.Repo: Repository handle, or None if path is not a valid Git repository
+        """
+        git = _load_git()
+        try:
+            return git.Repo(path)
+        except git.InvalidGitRepositoryError:
+            return None
         except Exception:
-            return False
+            return None
     
     def is_git_repository(self, path):
         """
@@ -78,13 +132,47 @@ class GitOperations:
         Returns:
             bool: True if valid Git repository, False otherwise
         """
-        try:
-            Repo(path)
-            return True
-        except InvalidGitRepositoryError:
-            return False
-        except Exception:
-            return False
+        return self._open_repo(path) is not None
+    
+    def _auth_env(self, remote_url, github_token, git_version=None):
+        """
+        Build environment variables that pass a GitHub token to git.
+        
+        On git 2.31+ the token is supplied as an HTTP header through git's
+        GIT_CONFIG_* variables. Older git ignores those, so it gets an
+        askpass helper that reads the token from the environment instead.
+        Either way the token applies to a single command and is never
+        written to the repository's .git/config.
+        
+        Args:
+            remote_url (str): Remote URL being pushed to
+            github_token (str): GitHub token, or None
+            git_version (tuple): Version of the git executable, queried if None
+            
+        Returns:
+            dict: Environment variables, empty if no authentication applies
+        """
+        if not github_token or not remote_url.startswith('https://github.com/'):
+            return {}
+        
+        if git_version is None:
+            git_version = _load_git().Git().version_info
+        
+        # Fail instead of waiting on a terminal prompt if the token is rejected
+        env = {'GIT_TERMINAL_PROMPT': '0'}
+        if git_version >= _GIT_CONFIG_ENV_VERSION:
+            credentials = base64.b64encode(f"x-access-token:{github_token}".encode()).decode()
+            env.update({
+                'GIT_CONFIG_COUNT': '1',
+                'GIT_CONFIG_KEY_0': 'http.https://github.com/.extraheader',
+                'GIT_CONFIG_VALUE_0': f"AUTHORIZATION: basic {credentials}",
+            })
+        else:
+            env.update({
+                'GIT_ASKPASS': _askpass_helper(),
+                'MCP_GIT_TOKEN': github_token,
+            })
+        return env
     
     def clone_repository(self, repo_url, local_path, dry_run=False):
         """
@@ -98,6 +186,7 @@ class GitOperations:
         Returns:
             bool: True if successful, False otherwise
         """
+        git = _load_git()
         try:
             # Validate repository URL
             if not self.is_valid_repo_url(repo_url):
@@ -132,12 +221,12 @@ class GitOperations:
             self.logger.info(f"Cloning repository {repo_url} to {local_path}...")
             
             # Clone the repository
-            repo = Repo.clone_from(repo_url, local_path)
+            repo = git.Repo.clone_from(repo_url, local_path)
             
             self.logger.info(f"Successfully cloned repository to {local_path}")
             return True
             
-        except GitCommandError as e:
+        except git.GitCommandError as e:
             if "Authentication failed" in str(e) or "access denied" in str(e).lower():
                 self.logger.error("Authentication failed. Please check your GitHub token.")
             elif "not found" in str(e).lower():
@@ -161,14 +250,14 @@ class GitOperations:
         Returns:
             bool: True if successful, False otherwise
         """
+        git = _load_git()
         try:
             # Validate local path is a Git repository
-            if not self.is_git_repository(local_path):
+            repo = self._open_repo(local_path)
+            if repo is None:
                 self.logger.error(f"Path {local_path} is not a valid Git repository")
                 return False
             
-            repo = Repo(local_path)
-            
             # Check if there are any changes to commit
             if not repo.is_dirty() and not repo.untracked_files:
                 self.logger.info("No changes to commit")
@@ -191,24 +280,19 @@ class GitOperations:
             default_branch = self.config.get_default_branch()
             
             # Push to remote
-            origin = repo.remote('origin')
+            origin = repo.remotes.origin
             
             # Configure authentication if token is available
-            github_token = self.config.get_github_token()
-            if github_token:
-                # Update remote URL to include token for authentication
-                remote_url = origin.url
-                if remote_url.startswith('https://github.com/'):
-                    auth_url = remote_url.replace('https://github.com/', f'https://{github_token}@github.com/')
-                    origin.set_url(auth_url)
+            auth_env = self._auth_env(origin.url, self.config.get_github_token(), repo.git.version_info)
             
             self.logger.info(f"Pushing changes to remote repository...")
-            origin.push(default_branch)
+            with repo.git.custom_environment(**auth_env):
+                origin.push(default_branch)
             
             self.logger.info("Successfully pushed changes to GitHub")
             return True
             
-        except GitCommandError as e:
+        except git.GitCommandError as e:
             if "Authentication failed" in str(e) or "access denied" in str(e).lower():
                 self.logger.error("Authentication failed. Please check your GitHub token.")
             elif "rejected" in str(e).lower():
@@ -219,3 +303,39 @@ class GitOperations:
         except Exception as e:
             self.logger.error(f"Failed to push changes: {e}")
             return False
+    
+    def commit_files(self, local_path, file_paths, commit_message, dry_run=False):
+        """
+        Stage the given files and record them in a single commit.
+        
+        Args:
+            local_path (str): Path to local Git repository
+            file_paths (list): File paths relative to the repository root
+            commit_message (str): Commit message
+            dry_run (bool): If True, simulate operation without making changes
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        git = _load_git()
+        try:
+            repo = self._open_repo(local_path)
+            if repo is None:
+                self.logger.error(f"Path {local_path} is not a valid Git repository")
+                return False
+            
+            if dry_run:
+                self.logger.info(f"[DRY RUN] Would stage {len(file_paths)} files and commit with message: '{commit_message}'")
+                return True
+            
+            repo.git.add('--', *file_paths)
+            repo.index.commit(commit_message)
+            self.logger.info(f"Committed {len(file_paths)} files with message: '{commit_message}'")
+            return True
+            
+        except git.GitCommandError as e:
+            self.logger.error(f"Git error during commit: {e}")
+            return False
+        except Exception as e:
+            self.logger.error(f"Failed to commit files: {e}")
+            return False
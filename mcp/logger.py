@@ -3,13 +3,20 @@ Logging module for MCP tool.
 Provides console and file logging with configurable verbosity levels.
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from pathlib import Path
 
 
+# Shared logger configuration used by get_logger()
+_INSTANCE = None
+
+
 class MCPLogger:
-    """Logger class for MCP tool with console and file output."""
+    """Logger configuration for MCP tool with console and file output."""
     
     def __init__(self, verbose=False, log_file="mcp.log"):
         """
@@ -22,10 +29,13 @@ class MCPLogger:
         self.verbose = verbose
         self.log_file = log_file
         self.logger = logging.getLogger('mcp')
+        self._listener = None
         self.logger.setLevel(logging.DEBUG if verbose else logging.INFO)
         
-        # Clear existing handlers
-        self.logger.handlers.clear()
+        # Release handlers left by a previous configuration before replacing them
+        for handler in self.logger.handlers[:]:
+            self.logger.removeHandler(handler)
+            handler.close()
         
         # Create formatters
         console_formatter = logging.Formatter(
@@ -41,41 +51,54 @@ class MCPLogger:
         console_handler.setFormatter(console_formatter)
         self.logger.addHandler(console_handler)
         
-        # File handler
+        # File handler, written from a background thread so log calls
+        # only enqueue the record instead of blocking on disk I/O
         try:
             file_handler = logging.FileHandler(log_file)
             file_handler.setLevel(logging.DEBUG)
             file_handler.setFormatter(file_formatter)
-            self.logger.addHandler(file_handler)
+            
+            log_queue = queue.Queue(-1)
+            self._listener = logging.handlers.QueueListener(
+                log_queue, file_handler, respect_handler_level=True
+            )
+            self._listener.start()
+            atexit.register(self.close)
+            
+            queue_handler = logging.handlers.QueueHandler(log_queue)
+            queue_handler.setLevel(logging.DEBUG)
+            self.logger.addHandler(queue_handler)
         except Exception as e:
             self.logger.warning(f"Could not create log file {log_file}: {e}")
     
-    def info(self, message):
-        """Log info message."""
-        self.logger.info(message)
-    
-    def error(self, message):
-        """Log error message."""
-        self.logger.error(message)
-    
-    def debug(self, message):
-        """Log debug message."""
-        self.logger.debug(message)
-    
-    def warning(self, message):
-        """Log warning message."""
-        self.logger.warning(message)
+    def close(self):
+        """Flush pending file log records and stop the background writer."""
+        if self._listener is not None:
+            self._listener.stop()
+            for handler in self._listener.handlers:
+                handler.close()
+            self._listener = None
 
 
 def get_logger(verbose=False, log_file="mcp.log"):
     """
-    Get a configured logger instance.
+    Get the configured MCP logger.
+    
+    The standard library logger is returned directly rather than wrapped,
+    so callers get its isEnabledFor fast path and lazy %-style formatting.
+    Its configuration is shared across the process and only rebuilt when
+    the requested verbosity or log file changes.
     
     Args:
         verbose (bool): Enable verbose logging
         log_file (str): Path to log file
         
     Returns:
-        MCPLogger: Configured logger instance
+        logging.Logger: Configured logger
     """
-    return MCPLogger(verbose=verbose, log_file=log_file)
+    global _INSTANCE
+    if _INSTANCE is None or _INSTANCE.verbose != verbose or _INSTANCE.log_file != log_file:
+        if _INSTANCE is not None:
+            _INSTANCE.close()
+        _INSTANCE = MCPLogger(verbose=verbose, log_file=log_file)
+    return _INSTANCE.logger
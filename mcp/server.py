@@ -4,45 +4,123 @@ Provides REST API endpoints and SSE support for GitHub repository management
 """
 
 import asyncio
-import json
+import hashlib
+import heapq
+import hmac
+import importlib.util
+import itertools
 import os
+import re
+import signal
+import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, Security
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi import FastAPI, BackgroundTasks, Query, Request, Response
 from fastapi.responses import StreamingResponse, HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
+import orjson
 import uvicorn
 
-from .config import MCPConfig
+from .config import get_config
 from .git_ops import GitOperations
 from .file_ops import FileOperations
 from .logger import get_logger
 
-# Security
-security = HTTPBearer()
-
-# Global variables for server state
-active_operations: Dict[str, Dict] = {}
+# Global variables for server state; operations are kept in creation order
+active_operations: "OrderedDict[str, Dict]" = OrderedDict()
 logger = get_logger()
 
+# Bounds on retained operation history: finished operations are evicted
+# oldest-first beyond the cap, and expire after the TTL (seconds)
+_MAX_OPERATIONS = int(os.getenv("MCP_MAX_OPERATIONS", "1000"))
+_OPERATION_TTL = float(os.getenv("MCP_OPERATION_TTL", "3600"))
+_TERMINAL_STATUSES = ("completed", "failed")
+
+# Stamped on an operation at every mutation; comparing versions is how
+# clients tell whether an operation changed since they last saw it
+_ops_version = itertools.count(1)
+
+# (expiry on the monotonic clock, operation_id) for finished operations,
+# drained by a single sweeper task instead of one loop timer per operation
+_expiry_heap: List[Tuple[float, str]] = []
+
+# Per-client SSE queues; batches of operation changes are pushed to each of them
+_subscribers: Set[asyncio.Queue] = set()
+_SUBSCRIBER_QUEUE_SIZE = 256
+_HEARTBEAT_INTERVAL = 30
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+
+# Latest pending event per operation, flushed to subscribers once per window
+# so bursts of updates to the same operation reach clients as one event
+_dirty: Dict[str, Dict] = {}
+_flush_soon: Optional[asyncio.Event] = None
+_COALESCE_WINDOW = 0.05
+
+# Limits how many clone/push/add-file operations run at once; others wait queued
+_MAX_CONCURRENT_OPS = int(os.getenv("MCP_MAX_CONCURRENT_OPS", "4"))
+_op_sem: Optional[asyncio.Semaphore] = None
+
+# _op_sem, _flush_soon and the background tasks belong to the loop running the
+# app. They are created by ensure_loop_state() rather than at import: before 3.10
+# asyncio primitives bind to the loop current at construction, and uvicorn starts
+# its own loop after this module is imported
+_state_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_tasks: List[asyncio.Task] = []
+
 class ServerConfig:
     """Server configuration settings"""
     def __init__(self):
         self.host = os.getenv("MCP_SERVER_HOST", "127.0.0.1")
         self.port = int(os.getenv("MCP_SERVER_PORT", "8000"))
+        self.workers = int(os.getenv("MCP_SERVER_WORKERS", "1"))
         self.api_key = os.getenv("MCP_API_KEY", "mcp-default-key")
         self.enable_cors = os.getenv("MCP_ENABLE_CORS", "true").lower() == "true"
         self.log_level = os.getenv("MCP_LOG_LEVEL", "INFO")
+        self.audit_log = os.getenv("MCP_AUDIT_LOG", "false").lower() == "true"
 
 server_config = ServerConfig()
 
+# Served at / when static/index.html is not installed; encoded once at import
+_FALLBACK_HTML = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>MCP Server</title>
+            <style>
+                body { font-family: Arial, sans-serif; margin: 40px; text-align: center; }
+                .container { max-width: 600px; margin: 0 auto; }
+                .error { color: #e74c3c; }
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <h1>MCP Server</h1>
+                <p class="error">Web interface not found. Please ensure static files are properly installed.</p>
+                <p><a href="/docs">View API Documentation</a></p>
+            </div>
+        </body>
+        </html>
+        """.encode("utf-8")
+# ETags hash with blake2b: md5 is refused by FIPS-mode Python builds, and
+# usedforsecurity=False needs 3.9+
+_FALLBACK_ETAG = f'"{hashlib.blake2b(_FALLBACK_HTML, digest_size=16).hexdigest()}"'
+
+# Shared operation managers, reused by every background operation
+_config = get_config()
+_git_ops = GitOperations(config=_config)
+_file_ops = FileOperations()
+
 # Pydantic models for API requests/responses
 class CloneRequest(BaseModel):
     repo_url: str = Field(..., description="GitHub repository URL to clone")
@@ -58,36 +136,175 @@ class AddFileRequest(BaseModel):
     filename: str = Field(..., description="Name of the file to create")
     content: Optional[str] = Field("", description="Content of the file")
     
+# Operation records are built by this module already matching this schema
 class OperationResponse(BaseModel):
     operation_id: str = Field(..., description="Unique identifier for the operation")
-    status: str = Field(..., description="Operation status: pending, running, completed, failed")
+    status: str = Field(..., description="Operation status: pending, queued, running, completed, failed")
     message: str = Field(..., description="Status message")
     created_at: datetime = Field(..., description="Operation creation timestamp")
     completed_at: Optional[datetime] = Field(None, description="Operation completion timestamp")
     result: Optional[Dict[str, Any]] = Field(None, description="Operation result data")
     error: Optional[str] = Field(None, description="Error message if operation failed")
 
+# Routes skip response-model serialization and encode records straight to
+# JSON; response_model is kept for the OpenAPI schema
+_OPERATION_FIELDS = tuple(OperationResponse.model_fields)
+
+def operation_public(operation: Dict) -> Dict:
+    """Project an operation record onto the OperationResponse fields"""
+    return {field: operation.get(field) for field in _OPERATION_FIELDS}
+
+def json_response(content: Any, headers: Optional[Dict[str, str]] = None) -> Response:
+    """Encode content with orjson into a ready-made JSON response"""
+    return Response(content=orjson.dumps(content), media_type="application/json", headers=headers)
+
 class ServerStatus(BaseModel):
     status: str = Field(..., description="Server status")
     version: str = Field(..., description="MCP version")
     active_operations: int = Field(..., description="Number of active operations")
     uptime: str = Field(..., description="Server uptime")
 
-# Authentication dependency
-async def verify_api_key(credentials: HTTPAuthorizationCredentials = Security(security)):
-    """Verify API key authentication"""
-    if credentials.credentials != server_config.api_key:
-        raise HTTPException(status_code=401, detail="Invalid API key")
-    return credentials.credentials
+# Canned rejection responses; bodies are built once instead of raising HTTPException
+_UNAUTH_HEADERS = (
+    (b"content-type", b"application/json"),
+    (b"www-authenticate", b"Bearer"),
+)
+_UNAUTH_BODY = {"type": "http.response.body", "body": b'{"detail":"Invalid API key"}'}
+_NOT_FOUND_BODY = b'{"detail":"Operation not found"}'
+
+# Authentication middleware
+class ApiKeyASGIMiddleware:
+    """Pure ASGI middleware requiring a Bearer API key on /api and /events"""
+
+    protected_prefixes = ("/api", "/events")
+
+    def __init__(self, app, api_key: str):
+        self.app = app
+        self.api_key = api_key.encode()
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] == "http"
+            and scope["method"] != "OPTIONS"
+            and scope["path"].startswith(self.protected_prefixes)
+            and not self.is_authorized(scope["headers"])
+        ):
+            # Outer middleware (CORS) edits the header list in place, so hand out a copy
+            await send({"type": "http.response.start", "status": 401, "headers": list(_UNAUTH_HEADERS)})
+            await send(_UNAUTH_BODY)
+            return
+
+        await self.app(scope, receive, send)
+
+    def is_authorized(self, headers) -> bool:
+        """Check the Authorization header against the configured API key"""
+        for name, value in headers:
+            if name == b"authorization":
+                scheme, _, credentials = value.partition(b" ")
+                return scheme.lower() == b"bearer" and hmac.compare_digest(credentials.strip(), self.api_key)
+        return False
+
+# Audit logging middleware
+class AuditLogASGIMiddleware:
+    """Pure ASGI middleware logging POST requests to /api; polling GETs are never logged"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST" or not scope["path"].startswith("/api"):
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        start = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            client = scope.get("client")
+            logger.info(
+                "%s POST %s %d %.1fms",
+                client[0] if client else "-", scope["path"], status,
+                (time.perf_counter() - start) * 1000,
+            )
+
+# Static files with client-side caching
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that adds Cache-Control; content-hashed assets are cached forever"""
+
+    hashed_name = re.compile(r"\.[0-9a-f]{8,}\.[A-Za-z0-9]+$")
+
+    def file_response(self, full_path, stat_result, scope, status_code: int = 200) -> Response:
+        # The parent sets ETag/Last-Modified and answers If-None-Match with a 304
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if self.hashed_name.search(str(full_path)):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        else:
+            response.headers["Cache-Control"] = "public, max-age=300"
+        return response
 
 # Lifespan context manager
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
     logger.info(f"Starting MCP Server on {server_config.host}:{server_config.port}")
+
+    # The web interface doesn't change at runtime, so read it once
+    index_path = static_path / "index.html"
+    if index_path.exists():
+        app.state.index_html = index_path.read_bytes()
+        app.state.index_etag = f'"{hashlib.blake2b(app.state.index_html, digest_size=16).hexdigest()}"'
+    else:
+        app.state.index_html = _FALLBACK_HTML
+        app.state.index_etag = _FALLBACK_ETAG
+
+    # SIGHUP reloads ~/.mcp/config.json on the next operation
+    if hasattr(signal, "SIGHUP"):
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, _config.invalidate)
+        except (NotImplementedError, RuntimeError, ValueError):
+            # Not supported by this loop or outside the main thread
+            pass
+
+    ensure_loop_state()
+
     yield
+
+    stop_loop_state()
     logger.info("Shutting down MCP Server")
 
+def ensure_loop_state():
+    """Create the loop-bound server state for the running loop if not done yet"""
+    # lifespan calls this at startup; operations and SSE clients call it too so
+    # hosts that skip lifespan events (e.g. uvicorn --lifespan off) still work
+    global _state_loop, _op_sem, _flush_soon
+    loop = asyncio.get_running_loop()
+    if _state_loop is loop:
+        return
+
+    _state_loop = loop
+    _op_sem = asyncio.Semaphore(_MAX_CONCURRENT_OPS)
+    _flush_soon = asyncio.Event()
+    _background_tasks[:] = [
+        loop.create_task(flush_events()),
+        loop.create_task(sweep_expired_operations()),
+    ]
+
+def stop_loop_state():
+    """Cancel the background tasks started by ensure_loop_state"""
+    global _state_loop
+    for task in _background_tasks:
+        task.cancel()
+    _background_tasks.clear()
+    _state_loop = None
+
 # Create FastAPI app
 app = FastAPI(
     title="MCP Server",
@@ -96,6 +313,13 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# Require the API key; added first so CORS wraps it and 401s carry CORS headers
+app.add_middleware(ApiKeyASGIMiddleware, api_key=server_config.api_key)
+
+# Uvicorn's access log is off; optionally audit mutating calls, including rejected ones
+if server_config.audit_log:
+    app.add_middleware(AuditLogASGIMiddleware)
+
 # Add CORS middleware
 if server_config.enable_cors:
     app.add_middleware(
@@ -106,17 +330,20 @@ if server_config.enable_cors:
         allow_headers=["*"],
     )
 
+# Compress larger JSON responses
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Mount static files
 static_path = Path(__file__).parent.parent / "static"
 if static_path.exists():
-    app.mount("/static", StaticFiles(directory=str(static_path)), name="static")
+    app.mount("/static", CachedStaticFiles(directory=str(static_path)), name="static")
 
 # Utility functions
 def create_operation(operation_type: str, params: Dict) -> str:
     """Create a new operation and return its ID"""
     operation_id = str(uuid.uuid4())
     active_operations[operation_id] = {
-        "id": operation_id,
+        "operation_id": operation_id,
         "type": operation_type,
         "status": "pending",
         "message": f"Operation {operation_type} created",
@@ -124,10 +351,29 @@ def create_operation(operation_type: str, params: Dict) -> str:
         "created_at": datetime.now(),
         "completed_at": None,
         "result": None,
-        "error": None
+        "error": None,
+        "version": next(_ops_version)
     }
+    evict_operations()
+    publish_operation(active_operations[operation_id], active_operations[operation_id]["created_at"])
     return operation_id
 
+def evict_operations():
+    """Drop the oldest finished operations while over the retention cap"""
+    excess = len(active_operations) - _MAX_OPERATIONS
+    if excess <= 0:
+        return
+
+    evicted = []
+    for operation_id, operation in active_operations.items():
+        if operation["status"] in _TERMINAL_STATUSES:
+            evicted.append(operation_id)
+            if len(evicted) == excess:
+                break
+
+    for operation_id in evicted:
+        del active_operations[operation_id]
+
 def update_operation(operation_id: str, status: str, message: str, result: Optional[Dict] = None, error: Optional[str] = None):
     """Update operation status"""
     if operation_id in active_operations:
@@ -135,28 +381,92 @@ def update_operation(operation_id: str, status: str, message: str, result: Optio
             "status": status,
             "message": message,
             "result": result,
-            "error": error
+            "error": error,
+            "version": next(_ops_version)
         })
-        if status in ["completed", "failed"]:
-            active_operations[operation_id]["completed_at"] = datetime.now()
+        now = datetime.now()
+        if status in _TERMINAL_STATUSES:
+            active_operations[operation_id]["completed_at"] = now
+            heapq.heappush(_expiry_heap, (time.monotonic() + _OPERATION_TTL, operation_id))
+        publish_operation(active_operations[operation_id], now)
+
+async def sweep_expired_operations():
+    """Remove finished operations once their TTL has passed"""
+    while True:
+        # The TTL is fixed, so anything pushed while sleeping expires after the head
+        delay = _expiry_heap[0][0] - time.monotonic() if _expiry_heap else _OPERATION_TTL
+        await asyncio.sleep(max(delay, 0))
+
+        now = time.monotonic()
+        while _expiry_heap and _expiry_heap[0][0] <= now:
+            _, operation_id = heapq.heappop(_expiry_heap)
+            active_operations.pop(operation_id, None)
+
+def publish_operation(operation: Dict, timestamp: datetime):
+    """Push an operation update event, stamped with the mutation time, to every connected SSE client"""
+    if not _subscribers:
+        return
+
+    event_data = {
+        'type': 'operation_update',
+        'operation_id': operation['operation_id'],
+        'status': operation['status'],
+        'message': operation['message'],
+        'version': operation['version'],
+        'timestamp': timestamp
+    }
+
+    if operation['status'] == 'completed' and operation.get('result'):
+        event_data['result'] = operation['result']
+    elif operation['status'] == 'failed' and operation.get('error'):
+        event_data['error'] = operation['error']
+
+    _dirty[operation['operation_id']] = event_data
+    if _flush_soon is not None:
+        _flush_soon.set()
+
+def sse_frames(events: List[Dict]) -> bytes:
+    """Encode events as consecutive SSE data frames"""
+    parts = []
+    for event in events:
+        parts += (_SSE_PREFIX, orjson.dumps(event), _SSE_SUFFIX)
+    return b"".join(parts)
+
+async def flush_events():
+    """Deliver coalesced operation events to SSE clients in batches"""
+    while True:
+        await _flush_soon.wait()
+        await asyncio.sleep(_COALESCE_WINDOW)
+        _flush_soon.clear()
+
+        batch = list(_dirty.values())
+        _dirty.clear()
+
+        for queue in _subscribers:
+            # Drop the oldest batch for clients that are not keeping up
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(batch)
 
 async def execute_clone_operation(operation_id: str, repo_url: str, local_path: str):
     """Execute clone operation in background"""
+    ensure_loop_state()
     try:
-        update_operation(operation_id, "running", "Cloning repository...")
-        
-        config = MCPConfig()
-        git_ops = GitOperations(config)
-        
-        # Validate repository URL
-        if not git_ops.is_valid_repo_url(repo_url):
-            raise ValueError(f"Invalid repository URL: {repo_url}")
+        update_operation(operation_id, "queued", "Waiting for a free operation slot...")
         
-        # Clone repository
-        result = git_ops.clone_repository(repo_url, local_path)
-        
-        update_operation(operation_id, "completed", "Repository cloned successfully", {"path": local_path})
-        logger.info(f"Clone operation {operation_id} completed successfully")
+        async with _op_sem:
+            update_operation(operation_id, "running", "Cloning repository...")
+            
+            # Validate repository URL
+            if not _git_ops.is_valid_repo_url(repo_url):
+                raise ValueError(f"Invalid repository URL: {repo_url}")
+            
+            # Clone repository off the event loop; relative paths are resolved
+            # against the server's working directory at dispatch time
+            result = await run_in_threadpool(_git_ops.clone_repository, repo_url, os.path.abspath(local_path))
+            
+            update_operation(operation_id, "completed", "Repository cloned successfully", {"path": local_path})
+            logger.info(f"Clone operation {operation_id} completed successfully")
         
     except Exception as e:
         error_msg = str(e)
@@ -165,21 +475,25 @@ async def execute_clone_operation(operation_id: str, repo_url: str, local_path:
 
 async def execute_push_operation(operation_id: str, repo_path: str, commit_message: str):
     """Execute push operation in background"""
+    ensure_loop_state()
     try:
-        update_operation(operation_id, "running", "Pushing changes...")
-        
-        config = MCPConfig()
-        git_ops = GitOperations(config)
+        update_operation(operation_id, "queued", "Waiting for a free operation slot...")
         
-        # Validate repository path
-        if not git_ops.is_git_repository(repo_path):
-            raise ValueError(f"Not a valid Git repository: {repo_path}")
-        
-        # Push changes
-        result = git_ops.push_changes(repo_path, commit_message)
-        
-        update_operation(operation_id, "completed", "Changes pushed successfully", {"commit_message": commit_message})
-        logger.info(f"Push operation {operation_id} completed successfully")
+        async with _op_sem:
+            update_operation(operation_id, "running", "Pushing changes...")
+            
+            # Resolve relative paths at dispatch time, as for clone
+            abs_repo_path = os.path.abspath(repo_path)
+            
+            # Validate repository path
+            if not await run_in_threadpool(_git_ops.is_git_repository, abs_repo_path):
+                raise ValueError(f"Not a valid Git repository: {repo_path}")
+            
+            # Push changes off the event loop
+            result = await run_in_threadpool(_git_ops.push_changes, abs_repo_path, commit_message)
+            
+            update_operation(operation_id, "completed", "Changes pushed successfully", {"commit_message": commit_message})
+            logger.info(f"Push operation {operation_id} completed successfully")
         
     except Exception as e:
         error_msg = str(e)
@@ -188,27 +502,29 @@ async def execute_push_operation(operation_id: str, repo_path: str, commit_messa
 
 async def execute_add_file_operation(operation_id: str, repo_path: str, section: str, filename: str, content: str):
     """Execute add file operation in background"""
+    ensure_loop_state()
     try:
-        update_operation(operation_id, "running", "Creating file...")
-        
-        file_ops = FileOperations()
-        
-        # Validate inputs
-        if not file_ops.is_valid_filename(filename):
-            raise ValueError(f"Invalid filename: {filename}")
-        
-        if not file_ops.is_valid_path(repo_path):
-            raise ValueError(f"Invalid repository path: {repo_path}")
+        update_operation(operation_id, "queued", "Waiting for a free operation slot...")
         
-        # Create file
-        result = file_ops.add_file_to_section(repo_path, section, filename, content)
-        
-        update_operation(operation_id, "completed", "File created successfully", {
-            "path": result,
-            "section": section,
-            "filename": filename
-        })
-        logger.info(f"Add file operation {operation_id} completed successfully")
+        async with _op_sem:
+            update_operation(operation_id, "running", "Creating file...")
+            
+            # Validate inputs
+            if not _file_ops.is_valid_filename(filename):
+                raise ValueError(f"Invalid filename: {filename}")
+            
+            if not _file_ops.is_valid_path(repo_path):
+                raise ValueError(f"Invalid repository path: {repo_path}")
+            
+            # Create file off the event loop; validated as relative, then resolved as for clone
+            result = await run_in_threadpool(_file_ops.add_file_to_section, os.path.abspath(repo_path), section, filename)
+            
+            update_operation(operation_id, "completed", "File created successfully", {
+                "path": result,
+                "section": section,
+                "filename": filename
+            })
+            logger.info(f"Add file operation {operation_id} completed successfully")
         
     except Exception as e:
         error_msg = str(e)
@@ -218,49 +534,31 @@ async def execute_add_file_operation(operation_id: str, repo_path: str, section:
 # API Routes
 
 @app.get("/", response_class=HTMLResponse)
-async def root():
+async def root(request: Request):
     """Root endpoint - serves the web interface"""
-    static_path = Path(__file__).parent.parent / "static" / "index.html"
-    if static_path.exists():
-        with open(static_path, 'r', encoding='utf-8') as f:
-            return f.read()
-    else:
-        return """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>MCP Server</title>
-            <style>
-                body { font-family: Arial, sans-serif; margin: 40px; text-align: center; }
-                .container { max-width: 600px; margin: 0 auto; }
-                .error { color: #e74c3c; }
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>MCP Server</h1>
-                <p class="error">Web interface not found. Please ensure static files are properly installed.</p>
-                <p><a href="/docs">View API Documentation</a></p>
-            </div>
-        </body>
-        </html>
-        """
+    etag = request.app.state.index_etag
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return HTMLResponse(
+        content=request.app.state.index_html,
+        headers={"ETag": etag, "Cache-Control": "public, max-age=300"}
+    )
 
 @app.get("/status", response_model=ServerStatus)
 async def get_status():
     """Get server status and health information"""
-    return ServerStatus(
-        status="running",
-        version="1.0.0",
-        active_operations=len([op for op in active_operations.values() if op["status"] in ["pending", "running"]]),
-        uptime="N/A"  # TODO: Implement uptime tracking
-    )
+    return json_response({
+        "status": "running",
+        "version": "1.0.0",
+        "active_operations": len([op for op in active_operations.values() if op["status"] in ["pending", "queued", "running"]]),
+        "uptime": "N/A"  # TODO: Implement uptime tracking
+    })
 
 @app.post("/api/clone", response_model=OperationResponse)
 async def clone_repository(
     request: CloneRequest,
-    background_tasks: BackgroundTasks,
-    api_key: str = Depends(verify_api_key)
+    background_tasks: BackgroundTasks
 ):
     """Clone a GitHub repository"""
     operation_id = create_operation("clone", {
@@ -276,14 +574,12 @@ async def clone_repository(
         request.local_path
     )
 
-    operation = active_operations[operation_id]
-    return OperationResponse(**operation)
+    return json_response(operation_public(active_operations[operation_id]))
 
 @app.post("/api/push", response_model=OperationResponse)
 async def push_changes(
     request: PushRequest,
-    background_tasks: BackgroundTasks,
-    api_key: str = Depends(verify_api_key)
+    background_tasks: BackgroundTasks
 ):
     """Push changes to GitHub repository"""
     operation_id = create_operation("push", {
@@ -299,14 +595,12 @@ async def push_changes(
         request.commit_message
     )
 
-    operation = active_operations[operation_id]
-    return OperationResponse(**operation)
+    return json_response(operation_public(active_operations[operation_id]))
 
 @app.post("/api/add-file", response_model=OperationResponse)
 async def add_file(
     request: AddFileRequest,
-    background_tasks: BackgroundTasks,
-    api_key: str = Depends(verify_api_key)
+    background_tasks: BackgroundTasks
 ):
     """Add a file to repository section"""
     operation_id = create_operation("add-file", {
@@ -326,101 +620,122 @@ async def add_file(
         request.content
     )
 
-    operation = active_operations[operation_id]
-    return OperationResponse(**operation)
+    return json_response(operation_public(active_operations[operation_id]))
 
 @app.get("/api/operations/{operation_id}", response_model=OperationResponse)
-async def get_operation(operation_id: str, api_key: str = Depends(verify_api_key)):
+async def get_operation(operation_id: str, request: Request):
     """Get status of a specific operation"""
-    if operation_id not in active_operations:
-        raise HTTPException(status_code=404, detail="Operation not found")
+    operation = active_operations.get(operation_id)
+    if operation is None:
+        return Response(content=_NOT_FOUND_BODY, status_code=404, media_type="application/json")
 
-    operation = active_operations[operation_id]
-    return OperationResponse(**operation)
+    # Pollers send back the version ETag and get a 304 until the operation changes
+    etag = f'"{operation["version"]}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return json_response(operation_public(operation), headers={"ETag": etag})
 
 @app.get("/api/operations", response_model=List[OperationResponse])
-async def list_operations(api_key: str = Depends(verify_api_key)):
-    """List all operations"""
-    operations = [OperationResponse(**op) for op in active_operations.values()]
-    return sorted(operations, key=lambda x: x.created_at, reverse=True)
+async def list_operations(
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of operations to return"),
+    status: Optional[str] = Query(None, description="Only return operations with this status")
+):
+    """List operations, newest first"""
+    # active_operations is the creation-ordered index: walking it backwards is
+    # newest-first without sorting, and islice stops after `limit` matches
+    operations = (
+        op for op in reversed(active_operations.values())
+        if status is None or op["status"] == status
+    )
+    return json_response([operation_public(op) for op in islice(operations, limit)])
 
 # Server-Sent Events endpoint
 @app.get("/events")
-async def stream_events(api_key: str = Depends(verify_api_key)):
+async def stream_events():
     """Stream real-time operation updates via Server-Sent Events"""
 
     async def event_generator():
         """Generate SSE events for operation updates"""
-        last_update = datetime.now()
-
-        # Send initial connection event
-        yield f"data: {json.dumps({'type': 'connected', 'message': 'Connected to MCP Server events', 'timestamp': datetime.now().isoformat()})}\n\n"
-
-        while True:
-            try:
-                # Check for operation updates
-                current_time = datetime.now()
-
-                # Send periodic heartbeat
-                if (current_time - last_update).seconds >= 30:
-                    yield f"data: {json.dumps({'type': 'heartbeat', 'timestamp': current_time.isoformat()})}\n\n"
-                    last_update = current_time
-
-                # Send operation status updates
-                for operation_id, operation in active_operations.items():
-                    # Send updates for recently modified operations
-                    if operation.get('last_sent_at', datetime.min) < operation.get('updated_at', operation['created_at']):
-                        event_data = {
-                            'type': 'operation_update',
-                            'operation_id': operation_id,
-                            'status': operation['status'],
-                            'message': operation['message'],
-                            'timestamp': current_time.isoformat()
-                        }
-
-                        if operation['status'] == 'completed' and operation.get('result'):
-                            event_data['result'] = operation['result']
-                        elif operation['status'] == 'failed' and operation.get('error'):
-                            event_data['error'] = operation['error']
-
-                        yield f"data: {json.dumps(event_data)}\n\n"
-                        operation['last_sent_at'] = current_time
-
-                # Wait before next check
-                await asyncio.sleep(1)
-
-            except Exception as e:
-                logger.error(f"Error in event stream: {e}")
-                yield f"data: {json.dumps({'type': 'error', 'message': str(e), 'timestamp': datetime.now().isoformat()})}\n\n"
-                break
+        ensure_loop_state()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_SUBSCRIBER_QUEUE_SIZE)
+        _subscribers.add(queue)
+
+        try:
+            # Send initial connection event
+            yield sse_frames([{'type': 'connected', 'message': 'Connected to MCP Server events', 'timestamp': datetime.now()}])
+
+            last_heartbeat = time.monotonic()
+
+            while True:
+                try:
+                    # Wait for the next operation update until the next heartbeat is due
+                    timeout = _HEARTBEAT_INTERVAL - (time.monotonic() - last_heartbeat)
+                    try:
+                        batch = await asyncio.wait_for(queue.get(), timeout=max(timeout, 0))
+                    except asyncio.TimeoutError:
+                        batch = [{'type': 'heartbeat', 'timestamp': datetime.now()}]
+                        last_heartbeat = time.monotonic()
+
+                    yield sse_frames(batch)
+
+                except Exception as e:
+                    logger.error(f"Error in event stream: {e}")
+                    yield sse_frames([{'type': 'error', 'message': str(e), 'timestamp': datetime.now()}])
+                    break
+        finally:
+            _subscribers.discard(queue)
 
     return StreamingResponse(
         event_generator(),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
+            # Opts the stream out of GZipMiddleware, which would buffer it
+            "Content-Encoding": "identity",
             "Connection": "keep-alive",
+            # Stops nginx-style reverse proxies from buffering the stream
+            "X-Accel-Buffering": "no",
             "Access-Control-Allow-Origin": "*",
             "Access-Control-Allow-Headers": "Cache-Control"
         }
     )
 
 # Server startup function
-def start_server(host: str = None, port: int = None, reload: bool = False):
+def _uvicorn_impl(module: str) -> str:
+    """Return module as the uvicorn implementation name if installed, else "auto" """
+    return module if importlib.util.find_spec(module) is not None else "auto"
+
+def start_server(host: str = None, port: int = None, reload: bool = False, workers: int = None):
     """Start the MCP server"""
     host = host or server_config.host
     port = port or server_config.port
+    workers = workers or server_config.workers
 
     logger.info(f"Starting MCP Server on {host}:{port}")
     logger.info(f"API Key: {server_config.api_key}")
     logger.info(f"CORS Enabled: {server_config.enable_cors}")
+    if workers > 1:
+        # Operations and SSE subscribers live in process memory
+        logger.warning(
+            f"Running {workers} workers, which do not share operations: operation polling "
+            f"can return 404 and /events can miss updates unless a reverse proxy pins "
+            f"each client to one worker"
+        )
 
     uvicorn.run(
         "mcp.server:app",
         host=host,
         port=port,
         reload=reload,
-        log_level=server_config.log_level.lower()
+        workers=workers,
+        log_level=server_config.log_level.lower(),
+        loop=_uvicorn_impl("uvloop"),
+        http=_uvicorn_impl("httptools"),
+        access_log=False,
+        proxy_headers=False,
+        server_header=False,
+        date_header=False
     )
 
 if __name__ == "__main__":
@@ -18,14 +18,21 @@ Examples:
   python mcp_server.py                          # Start server with default settings
   python mcp_server.py --host 0.0.0.0 --port 8080  # Start on all interfaces, port 8080
   python mcp_server.py --reload                 # Start with auto-reload for development
+  python mcp_server.py --workers 4              # 4 workers; requires a sticky-session proxy (see below)
   
 Environment Variables:
   MCP_SERVER_HOST     - Server host (default: 127.0.0.1)
   MCP_SERVER_PORT     - Server port (default: 8000)
+  MCP_SERVER_WORKERS  - Worker processes (default: 1)
   MCP_API_KEY         - API key for authentication (default: mcp-default-key)
   MCP_ENABLE_CORS     - Enable CORS (default: true)
   MCP_LOG_LEVEL       - Log level (default: INFO)
+  MCP_AUDIT_LOG       - Log POST requests to /api (default: false)
   GITHUB_TOKEN        - GitHub personal access token (required)
+
+Workers do not share operations or event subscribers. With more than one
+worker, GET /api/operations/{id} can return 404 and /events can miss updates
+unless a reverse proxy pins each client to a single worker.
         """
     )
     
@@ -48,13 +55,22 @@ Environment Variables:
         help="Enable auto-reload for development"
     )
     
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: 1). Workers do not share operations: "
+             "above 1, polling and /events break without a sticky-session proxy"
+    )
+    
     args = parser.parse_args()
     
     try:
         start_server(
             host=args.host,
             port=args.port,
-            reload=args.reload
+            reload=args.reload,
+            workers=args.workers
         )
     except KeyboardInterrupt:
         print("\nServer stopped by user")
@@ -3,17 +3,24 @@ Unit tests for MCP (Master Control Program) tool.
 Tests all major functionality with mocking to avoid external dependencies.
 """
 
+import asyncio
+import os
 import pytest
+import subprocess
+import sys
 import tempfile
 import shutil
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 import json
+import logging
 
 from mcp.config import MCPConfig
 from mcp.git_ops import GitOperations
 from mcp.file_ops import FileOperations
 from mcp.logger import get_logger
+from mcp.cli import parse_args, dispatch, UsageError
+from mcp import server
 
 
 class TestMCPConfig:
@@ -55,6 +62,26 @@ class TestMCPConfig:
             assert loaded_config['github_token'] == 'file_token'
             assert loaded_config['default_branch'] == 'develop'
     
+    @patch.dict('os.environ', {}, clear=True)
+    @patch('pathlib.Path.home')
+    @patch('mcp.config.load_dotenv')
+    def test_load_config_cached(self, mock_load_dotenv, mock_home):
+        """Test configuration is parsed once until invalidated."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            mock_home.return_value = Path(temp_dir)
+            config = MCPConfig()
+            
+            with open(config.config_file, 'w') as f:
+                json.dump({'default_branch': 'develop'}, f)
+            assert config.load_config()['default_branch'] == 'develop'
+            
+            with open(config.config_file, 'w') as f:
+                json.dump({'default_branch': 'release'}, f)
+            assert config.load_config()['default_branch'] == 'develop'
+            
+            config.invalidate()
+            assert config.load_config()['default_branch'] == 'release'
+    
     @patch.dict('os.environ', {'GITHUB_TOKEN': 'env_token'})
     def test_load_config_from_env(self):
         """Test loading configuration from environment variables."""
@@ -75,6 +102,13 @@ class TestMCPConfig:
             config = MCPConfig()
             token = config.get_github_token()
             assert token is None
+    
+    def test_get_config_shared(self):
+        """Test get_config returns one shared instance."""
+        from mcp.config import get_config
+        
+        assert get_config() is get_config()
+        assert isinstance(get_config(), MCPConfig)
 
 
 class TestGitOperations:
@@ -109,7 +143,88 @@ class TestGitOperations:
         for url in invalid_urls:
             assert git_ops.is_valid_repo_url(url) is False
     
-    @patch('mcp.git_ops.Repo')
+    def test_auth_env(self):
+        """Test GitHub token is passed through git config environment."""
+        git_ops = GitOperations()
+        
+        env = git_ops._auth_env('https://github.com/user/repo.git', 'secret')
+        assert env['GIT_CONFIG_KEY_0'] == 'http.https://github.com/.extraheader'
+        assert env['GIT_CONFIG_VALUE_0'].startswith('AUTHORIZATION: basic ')
+        
+        assert git_ops._auth_env('git@github.com:user/repo.git', 'secret') == {}
+        assert git_ops._auth_env('https://github.com/user/repo.git', None) == {}
+    
+    def _git_with_env(self, env, *args, stdin=None):
+        """Run git with only the given variables plus an isolated configuration."""
+        with tempfile.TemporaryDirectory() as home:
+            full_env = {'PATH': os.environ['PATH'], 'HOME': home, 'GIT_CONFIG_NOSYSTEM': '1', **env}
+            return subprocess.run(['git', *args], input=stdin, capture_output=True, text=True, env=full_env)
+    
+    def test_auth_env_header_applies(self):
+        """Test git itself picks up the token header for github.com only."""
+        git_ops = GitOperations()
+        env = git_ops._auth_env('https://github.com/user/repo.git', 'secret', (2, 31, 0))
+        
+        result = self._git_with_env(env, 'config', '--get-urlmatch', 'http.extraheader', 'https://github.com/user/repo.git')
+        assert result.stdout.strip() == env['GIT_CONFIG_VALUE_0']
+        result = self._git_with_env(env, 'config', '--get-urlmatch', 'http.extraheader', 'https://example.com/user/repo.git')
+        assert result.stdout.strip() == ''
+    
+    @pytest.mark.skipif(sys.platform == 'win32', reason="POSIX askpass script")
+    def test_auth_env_askpass_fallback(self):
+        """Test git older than 2.31 gets the token from the askpass helper."""
+        git_ops = GitOperations()
+        env = git_ops._auth_env('https://github.com/user/repo.git', 'secret', (2, 30, 9))
+        
+        assert 'GIT_CONFIG_COUNT' not in env
+        assert env['GIT_TERMINAL_PROMPT'] == '0'
+        result = self._git_with_env(env, 'credential', 'fill', stdin='protocol=https\nhost=github.com\n\n')
+        assert 'username=x-access-token' in result.stdout.splitlines()
+        assert 'password=secret' in result.stdout.splitlines()
+    
+    def test_push_changes_stages_all(self):
+        """Test push commits modified, deleted and untracked files through git's filters."""
+        import git
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            remote = git.Repo.init(Path(temp_dir) / 'remote.git', bare=True)
+            repo = git.Repo.init(Path(temp_dir) / 'work')
+            with repo.config_writer() as config:
+                config.set_value('user', 'name', 'Test')
+                config.set_value('user', 'email', 'test@example.com')
+                config.set_value('filter "upper"', 'clean', 'tr a-z A-Z')
+            work = Path(repo.working_tree_dir)
+            (work / '.gitattributes').write_text('*.up filter=upper\n')
+            (work / 'modified.txt').write_text('old')
+            (work / 'deleted.txt').write_text('gone')
+            repo.git.add(A=True)
+            repo.index.commit('initial')
+            repo.git.branch('-M', 'main')
+            repo.create_remote('origin', remote.working_dir)
+            
+            (work / 'modified.txt').write_text('new')
+            (work / 'deleted.txt').unlink()
+            (work / 'untracked.up').write_text('hello')
+            
+            config = Mock()
+            config.get_default_branch.return_value = 'main'
+            config.get_github_token.return_value = None
+            assert GitOperations(config=config).push_changes(str(work), 'update') is True
+            
+            tree = remote.commit('main').tree
+            assert sorted(blob.path for blob in tree.blobs) == ['.gitattributes', 'modified.txt', 'untracked.up']
+            assert tree['modified.txt'].data_stream.read() == b'new'
+            assert tree['untracked.up'].data_stream.read() == b'HELLO'
+    
+    def test_git_imported_lazily(self):
+        """Test importing the CLI does not import GitPython."""
+        result = subprocess.run(
+            [sys.executable, '-c', "import sys, mcp.cli; print('git' in sys.modules)"],
+            capture_output=True, text=True, cwd=Path(__file__).parent.parent
+        )
+        assert result.stdout.strip() == 'False'
+    
+    @patch('git.Repo')
     def test_is_git_repository_valid(self, mock_repo):
         """Test valid Git repository detection."""
         mock_repo.return_value = Mock()
@@ -118,7 +233,7 @@ class TestGitOperations:
         result = git_ops.is_git_repository('/path/to/repo')
         assert result is True
     
-    @patch('mcp.git_ops.Repo')
+    @patch('git.Repo')
     def test_is_git_repository_invalid(self, mock_repo):
         """Test invalid Git repository detection."""
         from git import InvalidGitRepositoryError
@@ -128,7 +243,7 @@ class TestGitOperations:
         result = git_ops.is_git_repository('/path/to/invalid')
         assert result is False
     
-    @patch('mcp.git_ops.Repo.clone_from')
+    @patch('git.Repo.clone_from')
     @patch('pathlib.Path.mkdir')
     @patch('pathlib.Path.exists')
     def test_clone_repository_success(self, mock_exists, mock_mkdir, mock_clone):
@@ -208,12 +323,21 @@ class TestFileOperations:
         invalid_paths = [
             '../../../etc/passwd',
             'src/../../../etc',
-            'path/with/../traversal'
+            'path/with/../traversal',
+            '/etc/passwd',
+            'src/CON/file'
         ]
         
         for path in invalid_paths:
             assert file_ops.is_valid_path(path) is False
     
+    def test_is_valid_path_backslash(self):
+        """Test a backslash separates path parts only on Windows."""
+        file_ops = FileOperations()
+        
+        assert file_ops.is_valid_path('src\\utils') is (os.sep == '\\')
+        assert file_ops.is_valid_path('src\\..\\..\\etc') is False
+    
     def test_create_directory_success(self):
         """Test successful directory creation."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -226,6 +350,43 @@ class TestFileOperations:
             assert new_dir.exists()
             assert new_dir.is_dir()
     
+    def test_create_directory_existing_file(self):
+        """Test directory creation fails when a file is in the way."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_ops = FileOperations()
+            existing = Path(temp_dir) / 'existing'
+            existing.touch()
+            
+            assert file_ops.create_directory(str(existing)) is False
+            assert file_ops.create_directory(temp_dir) is True
+    
+    def test_create_file_existing(self):
+        """Test creating a file that already exists."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_ops = FileOperations()
+            existing = Path(temp_dir) / 'existing.txt'
+            existing.touch()
+            
+            with patch('builtins.input', return_value='n'):
+                assert file_ops.create_file(str(existing)) is False
+            
+            assert file_ops.create_file(str(existing), overwrite=True) is True
+    
+    @pytest.mark.skipif(sys.platform == 'win32', reason="POSIX permissions")
+    def test_create_file_honors_umask(self):
+        """Test new files get touch's default mode of 0o666 minus the umask."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_ops = FileOperations()
+            new_file = Path(temp_dir) / 'shared.txt'
+            
+            old_umask = os.umask(0o002)
+            try:
+                assert file_ops.create_file(str(new_file)) is True
+            finally:
+                os.umask(old_umask)
+            
+            assert new_file.stat().st_mode & 0o777 == 0o664
+    
     def test_create_file_success(self):
         """Test successful file creation."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -267,6 +428,352 @@ class TestLogger:
         assert hasattr(logger, 'error')
         assert hasattr(logger, 'debug')
         assert hasattr(logger, 'warning')
+    
+    def test_get_logger_reuses_instance(self):
+        """Test logger instance and handlers are shared across calls."""
+        logger = get_logger()
+        handlers = list(logger.handlers)
+        assert get_logger() is logger
+        assert logger.handlers == handlers
+        assert len(handlers) == 2
+        
+        verbose_logger = get_logger(verbose=True)
+        assert verbose_logger.level == logging.DEBUG
+        assert len(verbose_logger.handlers) == 2
+
+
+class TestCLI:
+    """Test cases for command-line interface."""
+    
+    def test_parse_args_add_file(self):
+        """Test parsing global flags, positionals and command options."""
+        args = parse_args(['--dry-run', 'add-file', './repo', 'src/utils', 'helper.py', '--overwrite'])
+        
+        assert args.command == 'add-file'
+        assert args.dry_run is True
+        assert args.verbose is False
+        assert args.overwrite is True
+        assert (args.local_path, args.section, args.filename) == ('./repo', 'src/utils', 'helper.py')
+    
+    def test_parse_args_dash_message(self):
+        """Test a dash-prefixed argument with a space is positional, like argparse."""
+        args = parse_args(['push', './repo', '- fix typo'])
+        
+        assert (args.local_path, args.commit_message) == ('./repo', '- fix typo')
+        with pytest.raises(UsageError):
+            parse_args(['push', './repo', '-fix'])
+    
+    def test_parse_args_inline_and_abbreviated(self):
+        """Test --option=value and unambiguous prefixes are accepted like argparse."""
+        args = parse_args(['--dry', '--verb', 'add-files', './repo', '--manifest=files.txt', '--com=fix typo', '--over'])
+        
+        assert (args.dry_run, args.verbose, args.overwrite) == (True, True, True)
+        assert (args.manifest, args.commit) == ('files.txt', 'fix typo')
+        
+        with pytest.raises(UsageError):
+            parse_args(['push', './repo', 'message', '--verbose=yes'])
+    
+    def test_parse_args_invalid(self):
+        """Test invalid command lines raise UsageError."""
+        invalid_argv = [
+            ['bogus'],
+            ['clone', 'https://github.com/user/repo.git'],
+            ['push', './repo', 'message', 'extra'],
+            ['push', './repo', 'message', '--overwrite']
+        ]
+        
+        for argv in invalid_argv:
+            with pytest.raises(UsageError):
+                parse_args(argv)
+    
+    def test_parse_args_add_files_requires_manifest(self):
+        """Test add-files option parsing."""
+        args = parse_args(['add-files', './repo', '--manifest', 'files.txt', '--commit', 'Scaffold'])
+        assert (args.local_path, args.manifest, args.commit) == ('./repo', 'files.txt', 'Scaffold')
+        
+        with pytest.raises(UsageError):
+            parse_args(['add-files', './repo'])
+    
+    def test_dispatch_add_files(self):
+        """Test creating all files listed in a manifest."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manifest = Path(temp_dir) / 'files.txt'
+            manifest.write_text('# scaffold\nsrc/utils helper.py\n\ntests test_helper.py\n')
+            
+            result = dispatch(['add-files', temp_dir, '--manifest', str(manifest)])
+            
+            assert result == 0
+            assert (Path(temp_dir) / 'src' / 'utils' / 'helper.py').is_file()
+            assert (Path(temp_dir) / 'tests' / 'test_helper.py').is_file()
+    
+    def test_dispatch_help(self, capsys):
+        """Test help output without a command."""
+        assert dispatch([]) == 0
+        assert 'usage: mcp' in capsys.readouterr().out
+    
+    def test_dispatch_command_help(self, capsys):
+        """Test command help describes each argument."""
+        assert dispatch(['add-file', '-h']) == 0
+        out = capsys.readouterr().out
+        assert out.startswith('usage: mcp add-file [-h] [--overwrite] local_path section filename')
+        assert 'Section (subdirectory) path relative to repository root' in out
+        
+        assert dispatch(['add-files', '--help']) == 0
+        assert '"section filename" pair per line' in capsys.readouterr().out
+
+
+class TestServer:
+    """Test cases for MCP server."""
+    
+    @pytest.fixture
+    def client(self):
+        """Create an authenticated test client with no recorded operations."""
+        from fastapi.testclient import TestClient
+        server.active_operations.clear()
+        return TestClient(server.app, headers={'Authorization': f'Bearer {server.server_config.api_key}'})
+    
+    def test_root_etag(self):
+        """Test the web interface is served with an ETag and honors If-None-Match."""
+        from fastapi.testclient import TestClient
+        with TestClient(server.app) as client:
+            response = client.get('/')
+            assert response.status_code == 200
+            assert 'MCP Server' in response.text
+            
+            etag = response.headers['etag']
+            response = client.get('/', headers={'If-None-Match': etag})
+            assert response.status_code == 304
+    
+    def test_static_cache_headers(self):
+        """Test static files carry Cache-Control and revalidate via ETag."""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / 'app.js').write_text('console.log(1);')
+            (Path(temp_dir) / 'app.3f2a9c1b.js').write_text('console.log(2);')
+            app = FastAPI()
+            app.mount('/static', server.CachedStaticFiles(directory=temp_dir))
+            client = TestClient(app)
+            
+            response = client.get('/static/app.js')
+            assert response.headers['cache-control'] == 'public, max-age=300'
+            revalidated = client.get('/static/app.js', headers={'If-None-Match': response.headers['etag']})
+            assert revalidated.status_code == 304
+            
+            response = client.get('/static/app.3f2a9c1b.js')
+            assert response.headers['cache-control'] == 'public, max-age=31536000, immutable'
+    
+    def test_list_operations_gzip(self, client):
+        """Test large JSON responses are gzip-compressed."""
+        for _ in range(10):
+            server.create_operation('clone', {})
+        
+        response = client.get('/api/operations', headers={'Accept-Encoding': 'gzip'})
+        assert response.headers['content-encoding'] == 'gzip'
+        assert len(response.json()) == 10
+    
+    def test_api_key_required(self, client):
+        """Test API routes reject missing or wrong API keys."""
+        from fastapi.testclient import TestClient
+        anonymous = TestClient(server.app)
+        
+        assert anonymous.get('/api/operations').status_code == 401
+        assert anonymous.get('/api/operations', headers={'Authorization': 'Bearer wrong'}).status_code == 401
+        assert anonymous.get('/status').status_code == 200
+        assert client.get('/api/operations').status_code == 200
+    
+    def test_audit_log_only_posts(self):
+        """Test audit middleware logs API POSTs but not polling GETs."""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        app = FastAPI()
+        app.get('/api/ping')(lambda: {})
+        app.post('/api/ping')(lambda: {})
+        app.add_middleware(server.AuditLogASGIMiddleware)
+        client = TestClient(app)
+        
+        with patch.object(server, 'logger') as mock_logger:
+            client.get('/api/ping')
+            mock_logger.info.assert_not_called()
+            client.post('/api/ping')
+        
+        args = mock_logger.info.call_args[0]
+        assert args[2:4] == ('/api/ping', 200)
+    
+    def test_post_returns_operation(self, client):
+        """Test POST routes return the new operation record as JSON."""
+        with client:
+            response = client.post('/api/clone', json={'repo_url': 'not_a_url', 'local_path': 'repo'})
+        
+        assert response.status_code == 200
+        body = response.json()
+        assert set(body) == set(server.OperationResponse.model_fields)
+        assert body['operation_id'] in server.active_operations
+    
+    def test_operations_run_without_lifespan(self, client):
+        """Test operations complete when the host never runs lifespan events."""
+        with patch.object(server._git_ops, 'clone_repository', return_value=True):
+            response = client.post('/api/clone', json={'repo_url': 'https://github.com/user/repo', 'local_path': 'repo'})
+        
+        operation = server.active_operations[response.json()['operation_id']]
+        assert (operation['status'], operation['error']) == ('completed', None)
+    
+    def test_unknown_operation(self, client):
+        """Test unknown operation IDs return a JSON 404."""
+        response = client.get('/api/operations/missing')
+        
+        assert response.status_code == 404
+        assert response.json() == {'detail': 'Operation not found'}
+    
+    def test_get_operation_etag(self, client):
+        """Test polling an operation returns 304 until it changes."""
+        operation_id = server.create_operation('clone', {})
+        
+        response = client.get(f'/api/operations/{operation_id}')
+        etag = response.headers['etag']
+        assert client.get(f'/api/operations/{operation_id}', headers={'If-None-Match': etag}).status_code == 304
+        
+        server.update_operation(operation_id, 'failed', 'Clone operation failed', error='boom')
+        response = client.get(f'/api/operations/{operation_id}', headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.json()['status'] == 'failed'
+    
+    def test_evict_operations(self):
+        """Test oldest finished operations are evicted beyond the cap."""
+        server.active_operations.clear()
+        with patch('mcp.server._MAX_OPERATIONS', 2):
+            running_id = server.create_operation('clone', {})
+            completed_id = server.create_operation('clone', {})
+            server.active_operations[completed_id]['status'] = 'completed'
+            newest_id = server.create_operation('clone', {})
+        
+        assert list(server.active_operations) == [running_id, newest_id]
+    
+    def test_operations_wait_for_slot(self):
+        """Test queued operations run once a slot frees up in the server's loop."""
+        server.active_operations.clear()
+        
+        async def run():
+            with patch.object(server, '_MAX_CONCURRENT_OPS', 1), \
+                 patch.object(server._git_ops, 'clone_repository', return_value=True):
+                async with server.lifespan(server.app):
+                    ids = [server.create_operation('clone', {}) for _ in range(2)]
+                    await asyncio.gather(*(
+                        server.execute_clone_operation(op_id, 'https://github.com/user/repo', 'repo')
+                        for op_id in ids
+                    ))
+        
+        asyncio.run(run())
+        assert [op['status'] for op in server.active_operations.values()] == ['completed', 'completed']
+    
+    def test_executors_resolve_paths(self):
+        """Test relative paths are resolved against the server's directory at dispatch."""
+        server.active_operations.clear()
+        
+        async def run():
+            with patch.object(server._git_ops, 'clone_repository', return_value=True) as clone, \
+                 patch.object(server._git_ops, 'is_git_repository', return_value=True), \
+                 patch.object(server._git_ops, 'push_changes', return_value=True) as push, \
+                 patch.object(server._file_ops, 'add_file_to_section', return_value=True) as add_file:
+                await server.execute_clone_operation(server.create_operation('clone', {}), 'https://github.com/user/repo', 'repo')
+                await server.execute_push_operation(server.create_operation('push', {}), 'repo', 'message')
+                await server.execute_add_file_operation(server.create_operation('add_file', {}), 'repo', 'docs', 'a.md', '')
+            return clone.call_args[0][1], push.call_args[0][0], add_file.call_args[0][0]
+        
+        expected = os.path.abspath('repo')
+        assert asyncio.run(run()) == (expected, expected, expected)
+    
+    def test_flush_coalesces_updates(self):
+        """Test several updates to one operation reach subscribers as one event."""
+        server.active_operations.clear()
+        
+        async def run():
+            queue = asyncio.Queue(maxsize=4)
+            with patch.object(server, '_subscribers', {queue}), \
+                 patch.object(server, '_flush_soon', asyncio.Event()):
+                flusher = asyncio.create_task(server.flush_events())
+                first_id = server.create_operation('clone', {})
+                server.update_operation(first_id, 'running', 'Cloning repository...')
+                server.update_operation(first_id, 'completed', 'done', {'path': 'repo'})
+                second_id = server.create_operation('push', {})
+                batch = await asyncio.wait_for(queue.get(), timeout=1)
+                flusher.cancel()
+            return first_id, second_id, batch, queue.empty()
+        
+        first_id, second_id, batch, drained = asyncio.run(run())
+        assert [(e['operation_id'], e['status']) for e in batch] == [(first_id, 'completed'), (second_id, 'pending')]
+        assert batch[0]['result'] == {'path': 'repo'}
+        assert drained
+    
+    def test_flush_drops_oldest_batch(self):
+        """Test a full subscriber queue loses its oldest batch, not the newest."""
+        server.active_operations.clear()
+        
+        async def run():
+            queue = asyncio.Queue(maxsize=1)
+            queue.put_nowait(['stale'])
+            with patch.object(server, '_subscribers', {queue}), \
+                 patch.object(server, '_flush_soon', asyncio.Event()):
+                flusher = asyncio.create_task(server.flush_events())
+                operation_id = server.create_operation('clone', {})
+                await asyncio.sleep(server._COALESCE_WINDOW * 3)
+                flusher.cancel()
+            return operation_id, queue.get_nowait(), queue.empty()
+        
+        operation_id, batch, drained = asyncio.run(run())
+        assert [e['operation_id'] for e in batch] == [operation_id]
+        assert drained
+    
+    def test_event_stream_lifecycle(self):
+        """Test the event stream registers its queue, heartbeats when idle and unregisters."""
+        async def run():
+            subscribers = set()
+            with patch.object(server, '_subscribers', subscribers), \
+                 patch.object(server, '_HEARTBEAT_INTERVAL', 0.05):
+                stream = (await server.stream_events()).body_iterator
+                frames = [await stream.__anext__()]
+                registered = len(subscribers)
+                
+                next(iter(subscribers)).put_nowait([{'type': 'operation_update'}])
+                frames.append(await stream.__anext__())
+                frames.append(await asyncio.wait_for(stream.__anext__(), timeout=1))
+                await stream.aclose()
+            return frames, registered, len(subscribers)
+        
+        frames, registered, remaining = asyncio.run(run())
+        events = [json.loads(frame[len(b'data: '):]) for frame in frames]
+        assert all(frame.endswith(b'\n\n') for frame in frames)
+        assert [e['type'] for e in events] == ['connected', 'operation_update', 'heartbeat']
+        assert (registered, remaining) == (1, 0)
+    
+    def test_sweep_expired_operations(self):
+        """Test finished operations are removed once their TTL passes."""
+        server.active_operations.clear()
+        server._expiry_heap.clear()
+        
+        async def run():
+            with patch('mcp.server._OPERATION_TTL', 0):
+                operation_id = server.create_operation('clone', {})
+                server.update_operation(operation_id, 'completed', 'done')
+                sweeper = asyncio.create_task(server.sweep_expired_operations())
+                await asyncio.sleep(0.01)
+                sweeper.cancel()
+        
+        asyncio.run(run())
+        assert not server.active_operations
+        assert not server._expiry_heap
+    
+    def test_list_operations_limit_and_status(self, client):
+        """Test listing operations newest first with limit and status filters."""
+        ids = [server.create_operation('clone', {}) for _ in range(3)]
+        server.active_operations[ids[0]]['status'] = 'failed'
+        
+        response = client.get('/api/operations', params={'limit': 2})
+        assert [op['operation_id'] for op in response.json()] == [ids[2], ids[1]]
+        
+        response = client.get('/api/operations', params={'status': 'failed'})
+        assert [op['operation_id'] for op in response.json()] == [ids[0]]
 
 
 if __name__ == '__main__':